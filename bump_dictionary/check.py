@@ -0,0 +1,162 @@
+import copy
+import json
+from enum import Enum
+from pathlib import Path
+from typing import Any, FrozenSet, Iterable, List, NamedTuple, Optional
+
+from . import utils
+from .vocabulary import get_unknown_terms
+
+# Annotation keys that only exist in the legacy schema
+LEGACY_ANNOTATION_KEYS = {"Identifies", "Transformation"}
+
+
+class DictionaryStatus(str, Enum):
+    """Enum for the upgrade status of a data dictionary."""
+
+    CURRENT = "current"
+    UPGRADABLE = "upgradable"
+    INVALID = "invalid"
+    # A JSON file found in a directory search that does not look like a data dictionary
+    SKIPPED = "skipped"
+
+
+# The exit code of a check is that of the "worst" status found across all checked files.
+# NOTE: Exit code 2 is skipped because it is used by Typer/Click for usage errors.
+status_exit_codes = {
+    DictionaryStatus.SKIPPED: 0,
+    DictionaryStatus.CURRENT: 0,
+    DictionaryStatus.UPGRADABLE: 1,
+    DictionaryStatus.INVALID: 3,
+}
+# Exit code for when a check cannot be run at all, e.g. because a path does not exist
+CHECK_ERROR_EXIT_CODE = 4
+
+
+class CheckResult(NamedTuple):
+    """The outcome of checking a data dictionary file."""
+
+    status: DictionaryStatus
+    errors: List[str]
+
+
+def is_dictionary_like(data: Any) -> bool:
+    """Return True if JSON data has the shape of a data dictionary, i.e. a non-empty object of column objects."""
+    return (
+        isinstance(data, dict)
+        and bool(data)
+        and all(isinstance(col, dict) for col in data.values())
+    )
+
+
+def scan_dictionary_keys(data_dictionary: Any) -> DictionaryStatus:
+    """
+    Classify a data dictionary using only the keys present in its column annotations.
+
+    Annotations with a 'VariableType' and none of the legacy-only keys are treated as up-to-date,
+    and any other annotations as legacy. This is much cheaper than schema validation but does not
+    check the contents of the annotations, so a dictionary classified as upgradable may still
+    fail to upgrade.
+    """
+    if not isinstance(data_dictionary, dict):
+        return DictionaryStatus.INVALID
+
+    has_latest_cols = False
+    has_legacy_cols = False
+    for col in data_dictionary.values():
+        if not isinstance(col, dict):
+            return DictionaryStatus.INVALID
+        annotations = col.get("Annotations")
+        if annotations is None:
+            continue
+        if not isinstance(annotations, dict):
+            return DictionaryStatus.INVALID
+        if "VariableType" in annotations and not (
+            LEGACY_ANNOTATION_KEYS & annotations.keys()
+        ):
+            has_latest_cols = True
+        else:
+            has_legacy_cols = True
+
+    # A mix of up-to-date and legacy annotations is valid against neither schema
+    if has_latest_cols and has_legacy_cols:
+        return DictionaryStatus.INVALID
+    if has_legacy_cols:
+        return DictionaryStatus.UPGRADABLE
+    return DictionaryStatus.CURRENT
+
+
+def validate_dictionary_status(data_dictionary: Any) -> DictionaryStatus:
+    """
+    Classify a data dictionary by validating it against the latest and legacy schemas,
+    following the same steps as the upgrade itself.
+    """
+    if not utils.get_latest_schema_validation_errors(data_dictionary):
+        return DictionaryStatus.CURRENT
+    if utils.get_invalid_legacy_columns(data_dictionary):
+        return DictionaryStatus.INVALID
+
+    # The upgrade modifies the dictionary in place, so we work on a copy
+    updated_dict = utils.upgrade_dictionary(copy.deepcopy(data_dictionary))
+    if utils.get_latest_schema_validation_errors(updated_dict):
+        return DictionaryStatus.INVALID
+    return DictionaryStatus.UPGRADABLE
+
+
+def check_dictionary_file(
+    file: Path,
+    full_validation: bool = False,
+    vocabulary: Optional[FrozenSet[str]] = None,
+    skip_non_dictionaries: bool = False,
+) -> CheckResult:
+    """
+    Get the upgrade status of a data dictionary file.
+
+    If a vocabulary is provided, a data dictionary that references any unknown terms is considered invalid,
+    and the unknown terms in each column are returned as errors.
+    If skip_non_dictionaries is True, JSON files that do not have the shape of a data dictionary
+    (e.g., a BIDS dataset_description.json) are skipped instead of being reported as invalid.
+    """
+    try:
+        with open(file, "r", encoding="utf-8") as f:
+            data_dictionary = json.load(f)
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+        return CheckResult(DictionaryStatus.INVALID, [])
+
+    if skip_non_dictionaries and not is_dictionary_like(data_dictionary):
+        return CheckResult(DictionaryStatus.SKIPPED, [])
+
+    if full_validation:
+        status = validate_dictionary_status(data_dictionary)
+    else:
+        status = scan_dictionary_keys(data_dictionary)
+
+    if vocabulary is not None and status != DictionaryStatus.INVALID:
+        unknown_terms = get_unknown_terms(data_dictionary, vocabulary)
+        if unknown_terms:
+            return CheckResult(
+                DictionaryStatus.INVALID,
+                [
+                    f"{col_name}: unknown terms "
+                    + ", ".join(col_unknown_terms)
+                    for col_name, col_unknown_terms in unknown_terms.items()
+                ],
+            )
+    return CheckResult(status, [])
+
+
+def find_dictionary_files(paths: Iterable[Path]) -> List[Path]:
+    """
+    Expand the given paths into a sorted list of data dictionary files,
+    searching any directories recursively for JSON files.
+    """
+    files = []
+    for path in paths:
+        if path.is_dir():
+            # Skip any directories that happen to have a .json suffix
+            files.extend(
+                sorted(file for file in path.rglob("*.json") if file.is_file())
+            )
+        else:
+            files.append(path)
+    return files
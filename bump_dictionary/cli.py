@@ -1,13 +1,32 @@
 import json
+import sys
+import time
 from pathlib import Path
+from typing import FrozenSet, List, NoReturn, Optional
 
 import typer
-from pydantic import ValidationError
 from typing_extensions import Annotated
 
 from . import utils
-from .logger import VerbosityLevel, configure_logger, log_error, logger
-from .models import latest_dictionary_model, legacy_dictionary_model
+from .check import (
+    CHECK_ERROR_EXIT_CODE,
+    DictionaryStatus,
+    check_dictionary_file,
+    find_dictionary_files,
+    status_exit_codes,
+)
+from .logger import (
+    LogFormat,
+    VerbosityLevel,
+    configure_logger,
+    log_error,
+    logger,
+)
+from .ndjson import RecordStatus, upgrade_records
+from .vocabulary import get_unknown_terms, load_vocabulary
+from .watch import DictionaryWatcher, take_snapshot, watch_path
+
+DEFAULT_OUTPUT = Path("updated_dictionary.json")
 
 bump_dictionary = typer.Typer(
     help="Bump Neurobagel data dictionaries to the latest version of the data dictionary schema.",
@@ -21,24 +40,35 @@ def main(
     data_dictionary: Annotated[
         Path,
         typer.Argument(
-            help="Path to the Neurobagel data dictionary JSON file to be updated."
+            help="Path to the Neurobagel data dictionary JSON file to be updated. "
+            "With --check, this can also be a directory to be searched recursively for data dictionary JSON files "
+            "(JSON files that are not shaped like a data dictionary are skipped). "
+            "With --ndjson, this is a JSON-lines file of data dictionary records, or - to read from stdin. "
+            "With --watch, this can also be a directory of data dictionary JSON files to watch."
         ),
     ],
     output: Annotated[
-        Path,
+        Optional[Path],
         typer.Argument(
-            help="Path to save the updated data dictionary JSON file."
+            help="Path to save the updated data dictionary JSON file. Not used with --check or --ndjson.",
+            show_default=str(DEFAULT_OUTPUT),
         ),
-    ] = Path("updated_dictionary.json"),
+    ] = None,
     verbosity: Annotated[
         VerbosityLevel,
         typer.Option(
             "--verbosity",
             "-v",
-            callback=configure_logger,
-            help="Set the verbosity level of the output. 0 = show errors only; 1 = show errors, warnings, and informational messages; 3 = show all logs, including debug messages.",
+            help="Set the verbosity level of the output. 0 = show errors only; 1 = show errors, warnings, and informational messages; 2 = show all logs, including debug messages.",
         ),
     ] = VerbosityLevel.INFO,
+    log_format: Annotated[
+        LogFormat,
+        typer.Option(
+            "--log-format",
+            help="Set the format of the logs. Use plain or json to skip rich console rendering, e.g. for batch or CI runs.",
+        ),
+    ] = LogFormat.RICH,
     overwrite: Annotated[
         bool,
         typer.Option(
@@ -47,42 +77,138 @@ def main(
             help="Overwrite the output file if it already exists.",
         ),
     ] = False,
+    check: Annotated[
+        bool,
+        typer.Option(
+            "--check",
+            help="Only report whether the data dictionary (or each data dictionary in a directory) is current, upgradable, or invalid, without writing any output. "
+            "Exits with code 0 if all are current, 1 if any are upgradable, 3 if any are invalid, and 4 if the check could not be run (e.g., a path does not exist).",
+        ),
+    ] = False,
+    check_paths: Annotated[
+        Optional[List[Path]],
+        typer.Option(
+            "--check-path",
+            help="With --check, an additional data dictionary file or directory to check. Can be repeated.",
+        ),
+    ] = None,
+    full_validation: Annotated[
+        bool,
+        typer.Option(
+            "--full-validation",
+            help="With --check, validate each data dictionary against the legacy and latest schemas instead of only scanning the annotation keys. "
+            "Slower, but confirms that upgradable data dictionaries can actually be upgraded.",
+        ),
+    ] = False,
+    vocabulary_file: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--vocabulary",
+            exists=True,
+            file_okay=True,
+            dir_okay=False,
+            resolve_path=True,
+            help="Path to a text file of known term IDs (e.g., nb:Age), one per line. "
+            "If provided, data dictionaries referencing any term IDs not in this file are treated as invalid.",
+        ),
+    ] = None,
+    ndjson: Annotated[
+        bool,
+        typer.Option(
+            "--ndjson",
+            help='Read data dictionaries as JSON-lines records of the form {"id": ..., "dictionary": {...}}, '
+            "and stream one result record per input record to stdout, with the record id, input line number, status (upgraded, current, or invalid), data dictionary, and any errors. "
+            "Exits with code 1 if any record is invalid.",
+        ),
+    ] = False,
+    watch: Annotated[
+        bool,
+        typer.Option(
+            "--watch",
+            help="Keep running and re-upgrade the data dictionary (or each data dictionary in a directory) whenever it changes, "
+            "re-validating only the columns that were edited. "
+            "When watching a single file, the updated data dictionary is saved to the output file after each successful upgrade. "
+            "Watching a directory only reports the status of each data dictionary (skipping JSON files that are not shaped like a data dictionary, and hidden directories), "
+            "and does not write any output.",
+        ),
+    ] = False,
 ):
-    if output.exists() and not overwrite:
-        raise typer.Exit(
-            typer.style(
-                f"Output file {output} already exists. Use --overwrite or -f to overwrite.",
-                fg=typer.colors.RED,
-            )
+    if sum([check, ndjson, watch]) > 1:
+        raise typer.BadParameter(
+            "Only one of --check, --ndjson, or --watch can be used at a time."
+        )
+    if full_validation and not check:
+        raise typer.BadParameter(
+            "Can only be used together with --check.",
+            param_hint="'--full-validation'",
+        )
+    if check_paths and not check:
+        raise typer.BadParameter(
+            "Can only be used together with --check.",
+            param_hint="'--check-path'",
+        )
+    if check and output is not None:
+        raise typer.BadParameter(
+            "No output is written with --check. Use --check-path to check additional paths.",
+            param_hint="'OUTPUT'",
+        )
+    if ndjson and output is not None:
+        raise typer.BadParameter(
+            "Results are streamed to stdout with --ndjson. Redirect stdout to save them to a file.",
+            param_hint="'OUTPUT'",
+        )
+    if watch and output is not None and data_dictionary.is_dir():
+        raise typer.BadParameter(
+            "Watching a directory only reports the status of each data dictionary, and does not write any output.",
+            param_hint="'OUTPUT'",
+        )
+    if ndjson and overwrite:
+        raise typer.BadParameter(
+            "No output file is written with --ndjson.",
+            param_hint="'--overwrite'",
         )
 
-    input_dict = utils.load_json(data_dictionary)
+    configure_logger(verbosity, log_format)
 
-    latest_dictionary_schema = (
-        latest_dictionary_model.DataDictionary.model_json_schema()
+    vocabulary = (
+        load_vocabulary(
+            vocabulary_file,
+            error_exit_code=CHECK_ERROR_EXIT_CODE if check else 1,
+        )
+        if vocabulary_file
+        else None
     )
-    if not utils.get_validation_errors_for_schema(
-        input_dict, latest_dictionary_schema
-    ):
+
+    if check:
+        check_dictionaries(
+            [data_dictionary, *(check_paths or [])],
+            full_validation,
+            vocabulary,
+        )
+
+    output_path = output if output is not None else DEFAULT_OUTPUT
+    if ndjson:
+        upgrade_ndjson(data_dictionary, vocabulary)
+    if watch:
+        watch_dictionaries(
+            data_dictionary,
+            None if data_dictionary.is_dir() else output_path,
+            overwrite,
+            vocabulary,
+        )
+
+    exit_if_output_exists(output_path, overwrite)
+
+    input_dict = utils.load_json(data_dictionary)
+
+    if not utils.get_latest_schema_validation_errors(input_dict):
         log_error(
             logger,
             "Data dictionary is already up-to-date with the latest schema.",
         )
 
-    try:
-        legacy_dictionary_model.DataDictionary.model_validate(input_dict)
-    except ValidationError as legacy_schema_validation_errs:
-        invalid_cols = {}
-        # Below, we customize the user-facing error to avoid printing a large number of non-discriminative
-        # validation errors from Pydantic attempts to validate the dict against each possible column type
-        for validation_err in legacy_schema_validation_errs.errors():
-            # In a validation error, "loc" gives us the location of the error (the first item being the column name key)
-            # and "input" gives us the actual offending value (the contents of the column dict).
-            # Since a single column can produce multiple validation errors, here we collect each unique offending column once.
-            invalid_cols.update(
-                {validation_err["loc"][0]: validation_err["input"]}
-            )
-
+    invalid_cols = utils.get_invalid_legacy_columns(input_dict)
+    if invalid_cols:
         invalid_col_err_messages = ""
         for col_name, col_contents in invalid_cols.items():
             invalid_col_err_messages += (
@@ -97,11 +223,10 @@ def main(
             f"{invalid_col_err_messages}",
         )
 
-    updated_dict = utils.convert_transformation_to_format(input_dict)
-    updated_dict = utils.encode_variable_type(updated_dict)
+    updated_dict = utils.upgrade_dictionary(input_dict)
 
-    latest_schema_validation_errs = utils.get_validation_errors_for_schema(
-        updated_dict, latest_dictionary_schema
+    latest_schema_validation_errs = utils.get_latest_schema_validation_errors(
+        updated_dict
     )
     if latest_schema_validation_errs:
         validation_errs = ""
@@ -120,9 +245,184 @@ def main(
             "Please open an issue in https://github.com/neurobagel/bump-dictionary/issues.",
         )
 
-    with open(output, "w", encoding="utf-8") as f:
+    if vocabulary is not None:
+        unknown_terms = get_unknown_terms(updated_dict, vocabulary)
+        if unknown_terms:
+            unknown_term_err_messages = ""
+            for col_name, col_unknown_terms in unknown_terms.items():
+                unknown_term_err_messages += (
+                    f" -> {col_name}: " + ", ".join(col_unknown_terms) + "\n"
+                )
+            log_error(
+                logger,
+                "The data dictionary references term IDs that are not in the provided vocabulary.\n"
+                f"Found unknown terms in {len(unknown_terms)} column(s):\n"
+                f"{unknown_term_err_messages}",
+            )
+
+    with open(output_path, "w", encoding="utf-8") as f:
         json.dump(updated_dict, f, ensure_ascii=False, indent=2)
 
     logger.info(
-        f"Successfully updated data dictionary. Output saved to {output}"
+        f"Successfully updated data dictionary. Output saved to {output_path}"
+    )
+
+
+def check_dictionaries(
+    paths: List[Path],
+    full_validation: bool,
+    vocabulary: Optional[FrozenSet[str]] = None,
+) -> NoReturn:
+    """Report the upgrade status of one or more data dictionaries, and exit with a code reflecting the worst status."""
+    # Use a dedicated exit code so that a mistyped path is not mistaken for an upgradable data dictionary
+    for path in paths:
+        if not path.exists():
+            log_error(
+                logger,
+                f"Path does not exist: {path}",
+                exit_code=CHECK_ERROR_EXIT_CODE,
+            )
+
+    status_counts = {status: 0 for status in DictionaryStatus}
+    for path in paths:
+        # Only skip non-dictionary JSON files found by searching a directory,
+        # since an explicitly provided file is expected to be a data dictionary
+        is_dir = path.is_dir()
+        for file in find_dictionary_files([path]):
+            result = check_dictionary_file(
+                file,
+                full_validation,
+                vocabulary,
+                skip_non_dictionaries=is_dir,
+            )
+            status_counts[result.status] += 1
+            typer.echo(f"{file}: {result.status.value}")
+            for error in result.errors:
+                typer.echo(f" -> {error}")
+
+    logger.info(
+        "Checked %d data dictionary file(s): %s",
+        sum(status_counts.values()),
+        ", ".join(
+            f"{count} {status.value}"
+            for status, count in status_counts.items()
+        ),
+    )
+    raise typer.Exit(
+        code=max(
+            (
+                status_exit_codes[status]
+                for status, count in status_counts.items()
+                if count
+            ),
+            default=0,
+        )
+    )
+
+
+def upgrade_ndjson(
+    path: Path, vocabulary: Optional[FrozenSet[str]] = None
+) -> NoReturn:
+    """Upgrade each data dictionary record in a JSON-lines file or stdin, and stream the results to stdout."""
+    # Records are read as bytes and decoded per line by upgrade_records
+    if str(path) == "-":
+        records_file = sys.stdin.buffer
+    else:
+        if not path.exists():
+            log_error(logger, f"Path does not exist: {path}")
+        try:
+            records_file = open(path, "rb")
+        except OSError as err:
+            log_error(logger, f"Could not read {path}: {err.strerror}")
+
+    status_counts = {status: 0 for status in RecordStatus}
+    with records_file:
+        for result in upgrade_records(records_file, vocabulary):
+            status_counts[RecordStatus(result["status"])] += 1
+            typer.echo(json.dumps(result, ensure_ascii=False))
+
+    logger.info(
+        "Processed %d data dictionary record(s): %s",
+        sum(status_counts.values()),
+        ", ".join(
+            f"{count} {status.value}"
+            for status, count in status_counts.items()
+        ),
+    )
+    raise typer.Exit(code=1 if status_counts[RecordStatus.INVALID] else 0)
+
+
+def exit_if_output_exists(output: Path, overwrite: bool) -> None:
+    """Exit the app if the output file already exists and should not be overwritten."""
+    if output.exists() and not overwrite:
+        raise typer.Exit(
+            typer.style(
+                f"Output file {output} already exists. Use --overwrite or -f to overwrite.",
+                fg=typer.colors.RED,
+            )
+        )
+
+
+def watch_dictionaries(
+    path: Path,
+    output: Optional[Path],
+    overwrite: bool,
+    vocabulary: Optional[FrozenSet[str]] = None,
+) -> NoReturn:
+    """
+    Re-upgrade one or more data dictionaries whenever they change, reporting the result for each changed file,
+    until interrupted. If an output path is given, each successfully upgraded data dictionary is saved to it.
+    """
+    if not path.exists():
+        log_error(logger, f"Path does not exist: {path}")
+    if output is not None:
+        exit_if_output_exists(output, overwrite)
+
+    # As with --check, JSON files in a directory that are not shaped like a data dictionary are skipped
+    watcher = DictionaryWatcher(
+        vocabulary, skip_non_dictionaries=path.is_dir()
     )
+
+    def process_changes(changed: List[Path], removed: List[Path]) -> None:
+        for file in removed:
+            watcher.forget(file)
+            typer.echo(f"{file}: removed")
+        for file in changed:
+            start = time.perf_counter()
+            result = watcher.upgrade_file(file)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            if result is None:
+                typer.echo(f"{file}: skipped")
+                continue
+            typer.echo(
+                f"{file}: {result.status.value} "
+                f"({result.num_revalidated_cols} column(s) re-validated in {elapsed_ms:.1f} ms)"
+            )
+            for error in result.errors:
+                typer.echo(f" -> {error}")
+
+            if output is not None and result.status == RecordStatus.UPGRADED:
+                # Keep watching even if the output cannot be written this time
+                try:
+                    with open(output, "w", encoding="utf-8") as f:
+                        json.dump(
+                            result.data_dictionary,
+                            f,
+                            ensure_ascii=False,
+                            indent=2,
+                        )
+                except OSError as err:
+                    logger.error(
+                        "Could not save output to %s: %s",
+                        output,
+                        err.strerror,
+                    )
+                else:
+                    logger.info("Output saved to %s", output)
+
+    process_changes(sorted(take_snapshot(path)), [])
+    logger.info("Watching %s for changes. Press Ctrl+C to stop.", path)
+    try:
+        watch_path(path, process_changes)
+    except KeyboardInterrupt:
+        raise typer.Exit()
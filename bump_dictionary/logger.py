@@ -1,12 +1,17 @@
+import json
 import logging
 import sys
+from datetime import datetime
 from enum import Enum
 from typing import NoReturn
 
 import typer
+from rich.console import Console
 from rich.logging import RichHandler
+from rich.text import Text
 
 LOG_FMT = "%(message)s"
+PLAIN_LOG_FMT = "%(asctime)s %(levelname)s %(message)s"
 DATETIME_FMT = "[%Y-%m-%d %X]"
 
 # Check if code is currently running in a test environment
@@ -20,7 +25,6 @@ class VerbosityLevel(str, Enum):
 
     ERROR = "0"
     INFO = "1"
-    # NOTE: We currently do not have any debug logs, but can add them in the future
     DEBUG = "2"
 
 
@@ -31,18 +35,85 @@ verbosity_log_levels = {
 }
 
 
-def configure_logger(verbosity: VerbosityLevel = VerbosityLevel.INFO) -> None:
-    """Configure a logger with the specified logging level."""
-    level = verbosity_log_levels[verbosity]
+class LogFormat(str, Enum):
+    """Enum for log output formats."""
+
+    RICH = "rich"
+    PLAIN = "plain"
+    JSON = "json"
+
+
+def get_plain_message(record: logging.LogRecord) -> str:
+    """Get the message of a log record, with any rich markup removed."""
+    message = record.getMessage()
+    # Only messages logged with markup enabled are parsed, since other messages may contain literal square brackets
+    if getattr(record, "markup", False):
+        return Text.from_markup(message).plain
+    return message
+
+
+class PlainFormatter(logging.Formatter):
+    """Format log records as plain text, with any rich markup removed."""
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        record.message = get_plain_message(record)
+        return super().formatMessage(record)
+
 
-    # Prevent duplicate handlers when updating the logger
-    if not logger.handlers:
-        handler = RichHandler(
-            omit_repeated_times=False, show_path=False, rich_tracebacks=True
+class JsonFormatter(logging.Formatter):
+    """Format each log record as a single-line JSON object, with any rich markup removed."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return json.dumps(
+            {
+                "time": datetime.fromtimestamp(record.created)
+                .astimezone()
+                .isoformat(timespec="seconds"),
+                "level": record.levelname,
+                "message": get_plain_message(record),
+            },
+            ensure_ascii=False,
+        )
+
+
+def create_log_handler(log_format: LogFormat) -> logging.Handler:
+    """Create a handler that writes logs to stderr in the given format."""
+    # Log to stderr so that logs do not mix with any results streamed to stdout
+    if log_format == LogFormat.RICH:
+        handler: logging.Handler = RichHandler(
+            console=Console(stderr=True),
+            omit_repeated_times=False,
+            show_path=False,
+            rich_tracebacks=True,
         )
-        formatter = logging.Formatter(fmt=LOG_FMT, datefmt=DATETIME_FMT)
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        handler.setFormatter(
+            logging.Formatter(fmt=LOG_FMT, datefmt=DATETIME_FMT)
+        )
+    else:
+        # Plain and JSON output skip rich's console rendering, which is wasted on batch and CI runs
+        handler = logging.StreamHandler(sys.stderr)
+        if log_format == LogFormat.JSON:
+            handler.setFormatter(JsonFormatter())
+        else:
+            handler.setFormatter(
+                PlainFormatter(
+                    fmt=PLAIN_LOG_FMT, datefmt=DATETIME_FMT.strip("[]")
+                )
+            )
+    return handler
+
+
+def configure_logger(
+    verbosity: VerbosityLevel = VerbosityLevel.INFO,
+    log_format: LogFormat = LogFormat.RICH,
+) -> None:
+    """Configure a logger with the specified logging level and output format."""
+    level = verbosity_log_levels[verbosity]
+
+    # Replace any existing handler to prevent duplicate handlers when updating the logger
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+    logger.addHandler(create_log_handler(log_format))
 
     logger.setLevel(level)
     for handler in logger.handlers:
@@ -57,7 +128,8 @@ def configure_logger(verbosity: VerbosityLevel = VerbosityLevel.INFO) -> None:
 def log_error(
     logger: logging.Logger,
     message: str,
+    exit_code: int = 1,
 ) -> NoReturn:
     """Log an exception with an informative error message, and exit the app."""
     logger.error(message, extra={"markup": True})
-    raise typer.Exit(code=1)
+    raise typer.Exit(code=exit_code)
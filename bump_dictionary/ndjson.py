@@ -0,0 +1,140 @@
+import json
+from enum import Enum
+from typing import Any, FrozenSet, Iterable, Iterator, Optional
+
+from . import utils
+from .vocabulary import get_unknown_terms
+
+# Keys of each JSON-lines record
+ID_KEY = "id"
+DICTIONARY_KEY = "dictionary"
+# Key of each result record for the (1-based) line number of the input record
+LINE_KEY = "line"
+
+
+class RecordStatus(str, Enum):
+    """Enum for the outcome of upgrading a single JSON-lines record."""
+
+    UPGRADED = "upgraded"
+    CURRENT = "current"
+    INVALID = "invalid"
+
+
+def _result(
+    record_id: Any,
+    line_number: int,
+    status: RecordStatus,
+    data_dictionary: Optional[dict] = None,
+    errors: Optional[list] = None,
+) -> dict:
+    """Build a result record for a single JSON-lines record."""
+    return {
+        ID_KEY: record_id,
+        LINE_KEY: line_number,
+        "status": status.value,
+        DICTIONARY_KEY: data_dictionary,
+        "errors": errors or [],
+    }
+
+
+def upgrade_record(
+    line: bytes,
+    line_number: int,
+    vocabulary: Optional[FrozenSet[str]] = None,
+) -> dict:
+    """
+    Upgrade the data dictionary in a single JSON-lines record of the form {"id": ..., "dictionary": {...}}.
+
+    Returns a result record with the record ID, the line number of the record, the upgrade status,
+    the (upgraded) data dictionary, and any errors found.
+    Data dictionaries already valid against the latest schema are returned unchanged.
+    """
+    try:
+        record = json.loads(line.decode("utf-8"))
+    except UnicodeDecodeError:
+        return _result(
+            None,
+            line_number,
+            RecordStatus.INVALID,
+            errors=["Record must have UTF-8 encoding."],
+        )
+    except json.JSONDecodeError as err:
+        return _result(
+            None,
+            line_number,
+            RecordStatus.INVALID,
+            errors=[f"Not valid JSON: {err}"],
+        )
+    if not isinstance(record, dict) or DICTIONARY_KEY not in record:
+        return _result(
+            None,
+            line_number,
+            RecordStatus.INVALID,
+            errors=[
+                f"Record must be a JSON object with a '{DICTIONARY_KEY}' key."
+            ],
+        )
+
+    record_id = record.get(ID_KEY)
+    data_dictionary = record[DICTIONARY_KEY]
+
+    if not utils.get_latest_schema_validation_errors(data_dictionary):
+        status = RecordStatus.CURRENT
+    else:
+        invalid_cols = utils.get_invalid_legacy_columns(data_dictionary)
+        if invalid_cols:
+            return _result(
+                record_id,
+                line_number,
+                RecordStatus.INVALID,
+                errors=[
+                    f"{col_name}: {col_contents} is not a valid column annotation under the legacy schema"
+                    for col_name, col_contents in invalid_cols.items()
+                ],
+            )
+
+        data_dictionary = utils.upgrade_dictionary(data_dictionary)
+        latest_schema_validation_errs = (
+            utils.get_latest_schema_validation_errors(data_dictionary)
+        )
+        if latest_schema_validation_errs:
+            return _result(
+                record_id,
+                line_number,
+                RecordStatus.INVALID,
+                errors=[
+                    ".".join(map(str, error.path)) + f": {error.message}"
+                    for error in latest_schema_validation_errs
+                ],
+            )
+        status = RecordStatus.UPGRADED
+
+    if vocabulary is not None:
+        unknown_terms = get_unknown_terms(data_dictionary, vocabulary)
+        if unknown_terms:
+            return _result(
+                record_id,
+                line_number,
+                RecordStatus.INVALID,
+                errors=[
+                    f"{col_name}: unknown terms "
+                    + ", ".join(col_unknown_terms)
+                    for col_name, col_unknown_terms in unknown_terms.items()
+                ],
+            )
+
+    return _result(record_id, line_number, status, data_dictionary)
+
+
+def upgrade_records(
+    lines: Iterable[bytes], vocabulary: Optional[FrozenSet[str]] = None
+) -> Iterator[dict]:
+    """
+    Lazily upgrade each non-blank JSON-lines record.
+
+    Lines are decoded one at a time, so that a record with invalid encoding is reported
+    without stopping the remaining records.
+    """
+    for line_number, line in enumerate(lines, start=1):
+        if line.strip():
+            yield upgrade_record(line, line_number, vocabulary)
@@ -1,4 +1,5 @@
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Type
 
@@ -6,6 +7,7 @@ from jsonschema import Draft202012Validator
 from pydantic import ValidationError
 
 from .logger import log_error, logger
+from .models import latest_dictionary_model, legacy_dictionary_model
 from .models.legacy_dictionary_model import (
     CategoricalNeurobagel,
     ContinuousNeurobagel,
@@ -44,18 +46,70 @@ def get_validation_errors_for_schema(
     return errors
 
 
+@lru_cache(maxsize=None)
+def get_latest_schema_validator() -> Draft202012Validator:
+    """
+    Return a validator for the latest data dictionary schema.
+
+    The schema is generated and the validator built only once per process,
+    so that checking many data dictionaries does not repeat this work.
+    """
+    return Draft202012Validator(
+        latest_dictionary_model.DataDictionary.model_json_schema()
+    )
+
+
+def get_latest_schema_validation_errors(data_dictionary: dict) -> list:
+    """Validate the data dictionary against the latest schema and return all validation errors if any found."""
+    return list(get_latest_schema_validator().iter_errors(data_dictionary))
+
+
+def get_invalid_legacy_columns(data_dictionary: dict) -> dict:
+    """
+    Validate the data dictionary against the legacy schema and return any invalid columns,
+    as a mapping of column name to the offending column contents.
+    """
+    try:
+        legacy_dictionary_model.DataDictionary.model_validate(data_dictionary)
+    except ValidationError as legacy_schema_validation_errs:
+        invalid_cols = {}
+        # Below, we customize the user-facing error to avoid printing a large number of non-discriminative
+        # validation errors from Pydantic attempts to validate the dict against each possible column type
+        for validation_err in legacy_schema_validation_errs.errors():
+            # In a validation error, "loc" gives us the location of the error (the first item being the column name key)
+            # and "input" gives us the actual offending value (the contents of the column dict).
+            # Since a single column can produce multiple validation errors, here we collect each unique offending column once.
+            # NOTE: If the dictionary itself is not an object, "loc" is empty.
+            col_name = (
+                validation_err["loc"][0] if validation_err["loc"] else ""
+            )
+            invalid_cols.update({col_name: validation_err["input"]})
+        return invalid_cols
+    return {}
+
+
 def convert_transformation_to_format(data_dict: dict) -> dict:
     """
     Rename any 'Transformation' keys under 'Annotations' to 'Format'.
     """
+    renamed_cols = 0
     for col_name, col in data_dict.items():
         if "Transformation" in col.get("Annotations", {}):
-            logger.info(
-                f"Renaming 'Transformation' to 'Format' for column annotation: {col_name}"
+            logger.debug(
+                "Renaming 'Transformation' to 'Format' for column annotation: %s",
+                col_name,
             )
             col["Annotations"]["Format"] = col["Annotations"].pop(
                 "Transformation"
             )
+            renamed_cols += 1
+
+    # Log a single summary instead of a line per column, since rendering many log lines is slow
+    if renamed_cols:
+        logger.info(
+            "Renamed 'Transformation' to 'Format' in %d column annotation(s)",
+            renamed_cols,
+        )
 
     return data_dict
 
@@ -93,3 +147,9 @@ def encode_variable_type(data_dictionary: dict) -> dict:
                     break
 
     return data_dictionary
+
+
+def upgrade_dictionary(data_dictionary: dict) -> dict:
+    """Upgrade a data dictionary valid against the legacy schema to the latest schema."""
+    updated_dict = convert_transformation_to_format(data_dictionary)
+    return encode_variable_type(updated_dict)
@@ -0,0 +1,57 @@
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterator, List
+
+from .logger import log_error, logger
+
+
+def load_vocabulary(file: Path, error_exit_code: int = 1) -> FrozenSet[str]:
+    """
+    Load an index of known term IDs (e.g., 'nb:Age') from a text file with one term ID per line,
+    if the file has valid encoding. Otherwise, exit the app with the given exit code.
+
+    Blank lines and lines starting with '#' are ignored. Lookups against the index take constant time.
+    """
+    try:
+        with open(file, "r", encoding="utf-8") as f:
+            return frozenset(
+                term
+                for term in (line.strip() for line in f)
+                if term and not term.startswith("#")
+            )
+    except UnicodeDecodeError:
+        log_error(
+            logger,
+            f"Vocabulary file must have UTF-8 encoding: {file}. "
+            "[italic]TIP: Need help converting your file? Try a tool like iconv (http://linux.die.net/man/1/iconv) or https://www.freeformatter.com/convert-file-encoding.html.[/italic]",
+            exit_code=error_exit_code,
+        )
+
+
+def iter_term_urls(annotation: Any) -> Iterator[str]:
+    """Yield the TermURL of every controlled term nested anywhere in a column annotation."""
+    if isinstance(annotation, dict):
+        term_url = annotation.get("TermURL")
+        if isinstance(term_url, str):
+            yield term_url
+        for value in annotation.values():
+            yield from iter_term_urls(value)
+
+
+def get_unknown_terms(
+    data_dictionary: dict, vocabulary: FrozenSet[str]
+) -> Dict[str, List[str]]:
+    """
+    Return the term IDs in each column annotation that are not in the vocabulary,
+    as a mapping of column name to unknown term IDs. Columns without unknown terms are omitted.
+    """
+    unknown_terms = {}
+    for col_name, col in data_dictionary.items():
+        col_unknown_terms = [
+            term_url
+            for term_url in iter_term_urls(col.get("Annotations"))
+            if term_url not in vocabulary
+        ]
+        if col_unknown_terms:
+            # Preserve order of first appearance while dropping repeats
+            unknown_terms[col_name] = list(dict.fromkeys(col_unknown_terms))
+    return unknown_terms
@@ -0,0 +1,357 @@
+import copy
+import json
+import os
+import time
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from . import utils
+from .check import is_dictionary_like
+from .ndjson import RecordStatus
+from .vocabulary import get_unknown_terms
+
+# How often to check watched files for changes, in seconds
+POLL_INTERVAL = 0.2
+# How long watched files must stay unchanged before changes are processed, in seconds,
+# so that a burst of events (e.g., from an editor saving a file) triggers only one run
+DEBOUNCE_INTERVAL = 0.3
+# How long after its last modification a directory listing is trusted to be complete, in nanoseconds,
+# since an entry added within the same timestamp tick as a listing would not change the directory modification time
+RACY_LISTING_INTERVAL_NS = 2_000_000_000
+
+FileSnapshot = Dict[Path, Tuple[int, int]]
+
+
+class ColumnResult(NamedTuple):
+    """The validation and upgrade results for a single column of a data dictionary."""
+
+    latest_valid: bool
+    legacy_valid: bool
+    # Offending column contents if the column is not valid against the legacy schema
+    invalid_legacy_contents: Optional[Any]
+    upgraded: Optional[Any]
+    upgrade_errors: List[str]
+
+
+class WatchResult(NamedTuple):
+    """The outcome of re-upgrading a watched data dictionary file."""
+
+    status: RecordStatus
+    data_dictionary: Optional[dict]
+    errors: List[str]
+    num_revalidated_cols: int
+
+
+def validate_column(col_name: str, col: Any) -> ColumnResult:
+    """
+    Validate and, if needed, upgrade a single column.
+
+    Both the legacy and latest schemas validate each column independently,
+    so the results for the columns of a data dictionary can be combined to get the results for the whole dictionary.
+    """
+    col_dict = {col_name: col}
+    latest_valid = not utils.get_latest_schema_validation_errors(col_dict)
+
+    # A column valid against the latest schema must still be checked against the legacy schema,
+    # since any such columns make a data dictionary that is not up-to-date invalid
+    invalid_cols = utils.get_invalid_legacy_columns(col_dict)
+    if invalid_cols:
+        return ColumnResult(
+            latest_valid, False, invalid_cols[col_name], None, []
+        )
+    if latest_valid:
+        return ColumnResult(True, True, None, col, [])
+
+    # The upgrade modifies the column in place, so we work on a copy
+    upgraded_col_dict = utils.upgrade_dictionary(copy.deepcopy(col_dict))
+    upgrade_errors = [
+        ".".join(map(str, error.path)) + f": {error.message}"
+        for error in utils.get_latest_schema_validation_errors(
+            upgraded_col_dict
+        )
+    ]
+    return ColumnResult(
+        False, True, None, upgraded_col_dict[col_name], upgrade_errors
+    )
+
+
+class DictionaryWatcher:
+    """
+    Re-upgrades data dictionary files on request, caching the results for each column
+    so that only columns that changed since the last run of a file are re-validated.
+    """
+
+    def __init__(
+        self,
+        vocabulary: Optional[FrozenSet[str]] = None,
+        skip_non_dictionaries: bool = False,
+    ):
+        self.vocabulary = vocabulary
+        self.skip_non_dictionaries = skip_non_dictionaries
+        self._column_results: Dict[
+            Path, Dict[str, Tuple[Any, ColumnResult]]
+        ] = {}
+
+    def forget(self, file: Path) -> None:
+        """Drop the cached column results for a file."""
+        self._column_results.pop(file, None)
+
+    def upgrade_file(self, file: Path) -> Optional[WatchResult]:
+        """
+        Validate and upgrade a data dictionary file, re-validating only columns that changed since the last run.
+
+        If skip_non_dictionaries is True, None is returned for JSON files that do not have the shape
+        of a data dictionary (e.g., a BIDS dataset_description.json).
+        """
+        try:
+            with open(file, "r", encoding="utf-8") as f:
+                data_dictionary = json.load(f)
+        except OSError as err:
+            # The file may have been removed or replaced since it was found to have changed,
+            # e.g. by an editor that saves by renaming a temporary file
+            self.forget(file)
+            return WatchResult(
+                RecordStatus.INVALID,
+                None,
+                [f"Could not read file: {err.strerror}"],
+                0,
+            )
+        except UnicodeDecodeError:
+            return WatchResult(
+                RecordStatus.INVALID, None, ["Not UTF-8 encoded"], 0
+            )
+        except json.JSONDecodeError as err:
+            return WatchResult(
+                RecordStatus.INVALID, None, [f"Not valid JSON: {err}"], 0
+            )
+        if self.skip_non_dictionaries and not is_dictionary_like(
+            data_dictionary
+        ):
+            self.forget(file)
+            return None
+        if not isinstance(data_dictionary, dict):
+            self.forget(file)
+            return WatchResult(
+                RecordStatus.INVALID,
+                None,
+                ["Data dictionary must be a JSON object"],
+                0,
+            )
+
+        cached_results = self._column_results.get(file, {})
+        column_results = {}
+        num_revalidated_cols = 0
+        for col_name, col in data_dictionary.items():
+            cached = cached_results.get(col_name)
+            if cached is not None and cached[0] == col:
+                column_results[col_name] = cached
+            else:
+                column_results[col_name] = (
+                    col,
+                    validate_column(col_name, col),
+                )
+                num_revalidated_cols += 1
+        self._column_results[file] = column_results
+
+        return WatchResult(
+            *self._combine_column_results(
+                data_dictionary,
+                {
+                    col_name: result
+                    for col_name, (_, result) in column_results.items()
+                },
+            ),
+            num_revalidated_cols,
+        )
+
+    def _combine_column_results(
+        self, data_dictionary: dict, results: Dict[str, ColumnResult]
+    ) -> Tuple[RecordStatus, Optional[dict], List[str]]:
+        """Combine the results for each column into the status, upgraded data dictionary, and errors for the whole file."""
+        if all(result.latest_valid for result in results.values()):
+            status = RecordStatus.CURRENT
+            updated_dict = data_dictionary
+        else:
+            invalid_legacy_errors = [
+                f"{col_name}: {result.invalid_legacy_contents} is not a valid column annotation under the legacy schema"
+                for col_name, result in results.items()
+                if not result.legacy_valid
+            ]
+            if invalid_legacy_errors:
+                return RecordStatus.INVALID, None, invalid_legacy_errors
+
+            upgrade_errors = [
+                error
+                for result in results.values()
+                for error in result.upgrade_errors
+            ]
+            if upgrade_errors:
+                return RecordStatus.INVALID, None, upgrade_errors
+
+            status = RecordStatus.UPGRADED
+            updated_dict = {
+                col_name: result.upgraded
+                for col_name, result in results.items()
+            }
+
+        if self.vocabulary is not None:
+            unknown_terms = get_unknown_terms(updated_dict, self.vocabulary)
+            if unknown_terms:
+                return (
+                    RecordStatus.INVALID,
+                    None,
+                    [
+                        f"{col_name}: unknown terms "
+                        + ", ".join(col_unknown_terms)
+                        for col_name, col_unknown_terms in unknown_terms.items()
+                    ],
+                )
+        return status, updated_dict, []
+
+
+class DirectoryListing(NamedTuple):
+    """The cached contents of a watched directory."""
+
+    mtime_ns: int
+    listed_at_ns: int
+    subdirs: List[Path]
+    files: List[Path]
+
+
+class FileScanner:
+    """
+    Takes snapshots of the data dictionary files under a path.
+
+    Hidden directories (e.g., .git) are not searched, and each directory is only re-listed
+    when its modification time changes, i.e. when an entry is added to, removed from, or renamed in it,
+    so that repeated snapshots of an unchanged tree only need to stat its directories and JSON files.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._listings: Dict[Path, DirectoryListing] = {}
+
+    def snapshot(self) -> FileSnapshot:
+        """Get the modification time and size of each data dictionary file under the path."""
+        snapshot: FileSnapshot = {}
+        if self.path.is_dir():
+            listings: Dict[Path, DirectoryListing] = {}
+            self._scan_directory(self.path, snapshot, listings)
+            # Drop the listings of directories that no longer exist
+            self._listings = listings
+        else:
+            _add_file_stat(self.path, snapshot)
+        return snapshot
+
+    def _scan_directory(
+        self,
+        directory: Path,
+        snapshot: FileSnapshot,
+        listings: Dict[Path, DirectoryListing],
+    ) -> None:
+        """Add the JSON files in a directory and its non-hidden subdirectories to a snapshot."""
+        try:
+            mtime_ns = directory.stat().st_mtime_ns
+        except OSError:
+            return
+
+        cached = self._listings.get(directory)
+        if (
+            cached is not None
+            and cached.mtime_ns == mtime_ns
+            and cached.listed_at_ns - mtime_ns > RACY_LISTING_INTERVAL_NS
+        ):
+            listing = cached
+        else:
+            subdirs = []
+            files = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.name.startswith("."):
+                            continue
+                        # Symlinked directories are not followed, to avoid cycles
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(Path(entry.path))
+                        # Skip anything other than regular files (or links to them) with a .json suffix
+                        elif entry.name.endswith(".json") and entry.is_file():
+                            files.append(Path(entry.path))
+            except OSError:
+                return
+            listing = DirectoryListing(
+                mtime_ns, time.time_ns(), sorted(subdirs), sorted(files)
+            )
+        listings[directory] = listing
+
+        for file in listing.files:
+            _add_file_stat(file, snapshot)
+        for subdir in listing.subdirs:
+            self._scan_directory(subdir, snapshot, listings)
+
+
+def _add_file_stat(file: Path, snapshot: FileSnapshot) -> None:
+    """Add the modification time and size of a file to a snapshot, if the file still exists."""
+    try:
+        file_stat = file.stat()
+    except OSError:
+        return
+    snapshot[file] = (file_stat.st_mtime_ns, file_stat.st_size)
+
+
+def take_snapshot(path: Path) -> FileSnapshot:
+    """Get the modification time and size of each data dictionary file under a path."""
+    return FileScanner(path).snapshot()
+
+
+def get_changed_files(
+    previous: FileSnapshot, current: FileSnapshot
+) -> Tuple[List[Path], List[Path]]:
+    """Return the files that were added or modified, and the files that were removed, between two snapshots."""
+    changed = [
+        file
+        for file, file_stat in current.items()
+        if previous.get(file) != file_stat
+    ]
+    removed = [file for file in previous if file not in current]
+    return changed, removed
+
+
+def watch_path(
+    path: Path,
+    on_change: Callable[[List[Path], List[Path]], None],
+    poll_interval: float = POLL_INTERVAL,
+    debounce_interval: float = DEBOUNCE_INTERVAL,
+) -> None:
+    """
+    Poll a file or directory for changes to data dictionary files until interrupted,
+    calling on_change with the changed and removed files once the changes have settled.
+    """
+    scanner = FileScanner(path)
+    processed = scanner.snapshot()
+    while True:
+        time.sleep(poll_interval)
+        current = scanner.snapshot()
+        if current == processed:
+            continue
+
+        # Wait for a quiet period so that a burst of writes is handled as a single change
+        while True:
+            time.sleep(debounce_interval)
+            settled = scanner.snapshot()
+            if settled == current:
+                break
+            current = settled
+
+        changed, removed = get_changed_files(processed, current)
+        processed = current
+        if changed or removed:
+            on_change(changed, removed)
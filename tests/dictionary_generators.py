@@ -0,0 +1,113 @@
+"""
+Generators of random data dictionaries, derived from the legacy and latest data dictionary models.
+
+Dictionaries are generated by walking the Pydantic field definitions of a model, so that the generators
+stay in sync with the models. Since optional fields and union members are chosen at random,
+the generated dictionaries are not guaranteed to be valid (e.g., a legacy continuous annotation may
+include both or neither of 'Format' and 'Transformation'), and can additionally be mutated to make them invalid.
+"""
+
+import random
+import string
+from typing import Any, Dict, List, Literal, Type, Union, get_args, get_origin
+
+from pydantic import BaseModel, RootModel
+
+from bump_dictionary.models import (
+    latest_dictionary_model,
+    legacy_dictionary_model,
+)
+
+# Include non-ASCII characters to exercise the handling of non-ASCII output
+STRING_CHARACTERS = string.ascii_letters + string.digits + "éøßñ中文Ω🧠"
+
+
+def generate_string(rng: random.Random) -> str:
+    """Generate a random non-empty string, which may include non-ASCII characters."""
+    return "".join(rng.choices(STRING_CHARACTERS, k=rng.randint(1, 8)))
+
+
+def generate_value(annotation: Any, rng: random.Random) -> Any:
+    """Generate a random value for a field type annotation."""
+    origin = get_origin(annotation)
+    if origin is Literal:
+        return rng.choice(get_args(annotation))
+    if origin is Union:
+        return generate_value(rng.choice(get_args(annotation)), rng)
+    if origin in (list, List):
+        (item_type,) = get_args(annotation)
+        return list(
+            dict.fromkeys(
+                generate_value(item_type, rng)
+                for _ in range(rng.randint(0, 3))
+            )
+        )
+    if origin in (dict, Dict):
+        _, value_type = get_args(annotation)
+        return {
+            generate_string(rng): generate_value(value_type, rng)
+            for _ in range(rng.randint(1, 3))
+        }
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return generate_model(annotation, rng)
+    if annotation is str:
+        return generate_string(rng)
+    raise TypeError(f"Cannot generate a value for {annotation}")
+
+
+def generate_model(model: Type[BaseModel], rng: random.Random) -> Any:
+    """
+    Generate a random JSON-compatible instance of a model, using field aliases as keys.
+    Required fields are always included, and optional fields are included at random.
+    """
+    if issubclass(model, RootModel):
+        return generate_value(model.model_fields["root"].annotation, rng)
+
+    instance = {}
+    for field_name, field in model.model_fields.items():
+        if field.is_required() or rng.random() < 0.5:
+            instance[field.alias or field_name] = generate_value(
+                field.annotation, rng
+            )
+    return instance
+
+
+def mutate_dictionary(data_dictionary: dict, rng: random.Random) -> dict:
+    """Randomly remove a key from, or add an unexpected key to, the annotations of one column."""
+    annotated_cols = [
+        col for col in data_dictionary.values() if col.get("Annotations")
+    ]
+    if not annotated_cols:
+        return data_dictionary
+
+    annotations = rng.choice(annotated_cols)["Annotations"]
+    if rng.random() < 0.5:
+        annotations.pop(rng.choice(list(annotations)))
+    else:
+        annotations["Unexpected"] = generate_string(rng)
+    return data_dictionary
+
+
+def generate_dictionary(rng: random.Random) -> dict:
+    """
+    Generate a random legacy, latest, or mixed data dictionary,
+    which is mutated to be (likely) invalid some of the time.
+    """
+    kind = rng.choice(["legacy", "latest", "mixed"])
+    if kind == "legacy":
+        data_dictionary = generate_model(
+            legacy_dictionary_model.DataDictionary, rng
+        )
+    elif kind == "latest":
+        data_dictionary = generate_model(
+            latest_dictionary_model.DataDictionary, rng
+        )
+    else:
+        data_dictionary = {
+            **generate_model(legacy_dictionary_model.DataDictionary, rng),
+            **generate_model(latest_dictionary_model.DataDictionary, rng),
+        }
+
+    if rng.random() < 0.3:
+        data_dictionary = mutate_dictionary(data_dictionary, rng)
+    return data_dictionary
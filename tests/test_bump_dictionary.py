@@ -1,10 +1,23 @@
 import json
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import datetime
 from pathlib import Path
 
 import pytest
 from typer.testing import CliRunner
 
 from bump_dictionary.cli import bump_dictionary
+from bump_dictionary.logger import logger
+from bump_dictionary.watch import (
+    DictionaryWatcher,
+    FileScanner,
+    get_changed_files,
+    watch_path,
+)
 
 
 @pytest.fixture(scope="session")
@@ -82,7 +95,10 @@ def test_valid_legacy_dictionary_with_transformation_upgraded(
     output = load_test_json(example_output_path)
 
     assert result.exit_code == 0
-    assert "Renaming 'Transformation' to 'Format'" in caplog.text
+    assert (
+        "Renamed 'Transformation' to 'Format' in 1 column annotation(s)"
+        in caplog.text
+    )
     age_col = next(
         (
             col
@@ -137,3 +153,725 @@ def test_invalid_dictionary_not_upgraded(
     assert all(
         col in caplog.text for col in ["participant", "session", "pheno_age"]
     )
+
+
+@pytest.mark.parametrize(
+    "dictionary_file,expected_status,expected_exit_code",
+    [
+        ("latest_schema_dictionary.json", "current", 0),
+        ("legacy_schema_dictionary.json", "upgradable", 1),
+        ("legacy_schema_dictionary_with_transformation.json", "upgradable", 1),
+        # The key scan does not validate annotation contents
+        ("invalid_dictionary.json", "upgradable", 1),
+    ],
+)
+def test_check_reports_status_from_key_scan(
+    example_dictionaries_path,
+    runner,
+    tmp_path,
+    monkeypatch,
+    dictionary_file,
+    expected_status,
+    expected_exit_code,
+):
+    """Test that --check reports the status of a data dictionary from its annotation keys, without writing any output."""
+    monkeypatch.chdir(tmp_path)
+    result = runner.invoke(
+        bump_dictionary,
+        [str(example_dictionaries_path / dictionary_file), "--check"],
+    )
+
+    assert result.exit_code == expected_exit_code
+    assert f"{dictionary_file}: {expected_status}" in result.output
+    assert not any(tmp_path.iterdir())
+
+
+def test_check_with_full_validation_reports_invalid_dictionary(
+    example_dictionaries_path, runner
+):
+    """Test that --check with --full-validation reports a data dictionary that cannot be upgraded as invalid."""
+    result = runner.invoke(
+        bump_dictionary,
+        [
+            str(example_dictionaries_path / "invalid_dictionary.json"),
+            "--check",
+            "--full-validation",
+        ],
+    )
+
+    assert result.exit_code == 3
+    assert "invalid_dictionary.json: invalid" in result.output
+
+
+def test_check_directory_reports_each_file(
+    example_dictionaries_path, runner, tmp_path, caplog
+):
+    """Test that --check on a directory reports the status of every data dictionary file and exits with the worst status."""
+    (tmp_path / "not_json.json").write_text("{")
+    result = runner.invoke(
+        bump_dictionary,
+        [str(example_dictionaries_path), "--check", "--full-validation"],
+    )
+    assert result.exit_code == 3
+    assert "latest_schema_dictionary.json: current" in result.output
+    assert "legacy_schema_dictionary.json: upgradable" in result.output
+    assert "1 current, 2 upgradable, 1 invalid" in caplog.text
+
+    result = runner.invoke(bump_dictionary, [str(tmp_path), "--check"])
+    assert result.exit_code == 3
+    assert "not_json.json: invalid" in result.output
+
+
+def test_check_directory_skips_non_dictionary_files(
+    example_dictionaries_path, runner, tmp_path
+):
+    """
+    Test that --check on a directory skips JSON files that are not shaped like a data dictionary,
+    and does not fail on directories with a .json suffix.
+    """
+    (tmp_path / "dataset_description.json").write_text(
+        json.dumps({"Name": "My dataset", "BIDSVersion": "1.8.0"})
+    )
+    (tmp_path / "sub.json").mkdir()
+    (tmp_path / "participants.json").write_text(
+        (
+            example_dictionaries_path / "latest_schema_dictionary.json"
+        ).read_text()
+    )
+
+    result = runner.invoke(bump_dictionary, [str(tmp_path), "--check"])
+
+    assert result.exit_code == 0
+    assert "dataset_description.json: skipped" in result.output
+    assert "participants.json: current" in result.output
+    assert "sub.json" not in result.output
+
+
+def test_check_multiple_paths(example_dictionaries_path, runner):
+    """Test that --check accepts additional data dictionary files through --check-path and exits with the worst status."""
+    result = runner.invoke(
+        bump_dictionary,
+        [
+            str(example_dictionaries_path / "latest_schema_dictionary.json"),
+            "--check",
+            "--check-path",
+            str(example_dictionaries_path / "legacy_schema_dictionary.json"),
+        ],
+    )
+
+    assert result.exit_code == 1
+    assert "latest_schema_dictionary.json: current" in result.output
+    assert "legacy_schema_dictionary.json: upgradable" in result.output
+
+
+def test_check_missing_path_has_distinct_exit_code(
+    example_dictionaries_path, runner, tmp_path, caplog
+):
+    """Test that --check exits with a code distinct from any data dictionary status if a path does not exist."""
+    result = runner.invoke(
+        bump_dictionary,
+        [
+            str(example_dictionaries_path / "latest_schema_dictionary.json"),
+            "--check",
+            "--check-path",
+            str(tmp_path / "missing.json"),
+        ],
+    )
+
+    assert result.exit_code == 4
+    assert "Path does not exist" in caplog.text
+    assert "latest_schema_dictionary.json" not in result.output
+
+
+def test_check_unreadable_vocabulary_has_distinct_exit_code(
+    example_dictionaries_path, runner, tmp_path
+):
+    """Test that --check exits with a code distinct from any data dictionary status if the vocabulary cannot be loaded."""
+    vocabulary_path = tmp_path / "vocabulary.txt"
+    vocabulary_path.write_bytes("nb:\u00c2ge\n".encode("latin-1"))
+
+    result = runner.invoke(
+        bump_dictionary,
+        [
+            str(example_dictionaries_path / "latest_schema_dictionary.json"),
+            "--check",
+            "--vocabulary",
+            str(vocabulary_path),
+        ],
+    )
+
+    assert result.exit_code == 4
+
+
+@pytest.mark.parametrize(
+    "extra_args",
+    [
+        ["--check", "--ndjson"],
+        ["--ndjson", "--watch"],
+        ["out.jsonl", "--ndjson"],
+        ["--ndjson", "--overwrite"],
+        ["--full-validation"],
+        ["--check-path", "other.json"],
+        ["out.json", "--check"],
+    ],
+)
+def test_incompatible_options_rejected(
+    example_dictionaries_path, runner, extra_args
+):
+    """Test that incompatible combinations of options are rejected as usage errors."""
+    result = runner.invoke(
+        bump_dictionary,
+        [
+            str(example_dictionaries_path / "legacy_schema_dictionary.json"),
+            *extra_args,
+        ],
+    )
+
+    assert result.exit_code == 2
+    assert "Invalid value" in result.output
+
+
+@pytest.fixture(scope="function")
+def vocabulary_file(tmp_path):
+    def _write_vocabulary(terms):
+        vocabulary_path = tmp_path / "vocabulary.txt"
+        vocabulary_path.write_text(
+            "# Known term IDs\n" + "\n".join(terms) + "\n"
+        )
+        return vocabulary_path
+
+    return _write_vocabulary
+
+
+def test_unknown_terms_reported_per_column(
+    example_dictionaries_path,
+    runner,
+    example_output_path,
+    vocabulary_file,
+    caplog,
+):
+    """
+    Test that when a vocabulary is provided, a data dictionary referencing unknown term IDs is not upgraded,
+    and the unknown terms are reported for each offending column.
+    """
+    vocabulary_path = vocabulary_file(
+        ["nb:ParticipantID", "nb:SessionID", "nb:Age", "nb:FromEuro"]
+    )
+
+    result = runner.invoke(
+        bump_dictionary,
+        [
+            str(example_dictionaries_path / "legacy_schema_dictionary.json"),
+            str(example_output_path),
+            "--vocabulary",
+            str(vocabulary_path),
+        ],
+    )
+
+    assert result.exit_code != 0
+    assert not example_output_path.exists()
+    assert "not in the provided vocabulary" in caplog.text
+    assert "pheno_sex: nb:Sex, snomed:248153007" in caplog.text
+    assert "pheno_age" not in caplog.text
+
+
+def test_non_utf8_vocabulary_file_rejected(
+    example_dictionaries_path, runner, example_output_path, tmp_path, caplog
+):
+    """Test that a vocabulary file without UTF-8 encoding results in an informative error."""
+    vocabulary_path = tmp_path / "vocabulary.txt"
+    vocabulary_path.write_bytes("nb:Âge\n".encode("latin-1"))
+
+    result = runner.invoke(
+        bump_dictionary,
+        [
+            str(example_dictionaries_path / "legacy_schema_dictionary.json"),
+            str(example_output_path),
+            "--vocabulary",
+            str(vocabulary_path),
+        ],
+    )
+
+    assert result.exit_code == 1
+    assert "Vocabulary file must have UTF-8 encoding" in caplog.text
+    assert not example_output_path.exists()
+
+
+def test_known_terms_pass_vocabulary_check(
+    example_dictionaries_path,
+    load_test_json,
+    runner,
+    example_output_path,
+    vocabulary_file,
+):
+    """Test that a data dictionary referencing only known term IDs is upgraded when a vocabulary is provided."""
+    target_latest_dict = load_test_json(
+        example_dictionaries_path / "latest_schema_dictionary.json"
+    )
+    vocabulary_path = vocabulary_file(
+        [
+            "nb:Age",
+            "nb:Assessment",
+            "nb:Diagnosis",
+            "nb:FromEuro",
+            "nb:ParticipantID",
+            "nb:SessionID",
+            "nb:Sex",
+            "ncit:C94342",
+            "snomed:248152002",
+            "snomed:248153007",
+            "snomed:342061000000106",
+            "snomed:406506008",
+            "snomed:859351000000102",
+        ]
+    )
+
+    result = runner.invoke(
+        bump_dictionary,
+        [
+            str(example_dictionaries_path / "legacy_schema_dictionary.json"),
+            str(example_output_path),
+            "--vocabulary",
+            str(vocabulary_path),
+        ],
+    )
+    assert result.exit_code == 0
+    assert load_test_json(example_output_path) == target_latest_dict
+
+    result = runner.invoke(
+        bump_dictionary,
+        [
+            str(example_dictionaries_path / "legacy_schema_dictionary.json"),
+            "--check",
+            "--vocabulary",
+            str(vocabulary_file(["nb:Age"])),
+        ],
+    )
+    assert result.exit_code == 3
+    assert "legacy_schema_dictionary.json: invalid" in result.output
+    assert (
+        " -> participant_id: unknown terms nb:ParticipantID" in result.output
+    )
+    assert " -> pheno_sex: unknown terms nb:Sex, snomed:248153007" in (
+        result.output
+    )
+
+
+def test_ndjson_records_upgraded_from_stdin(
+    load_test_json, example_dictionaries_path, runner
+):
+    """Test that JSON-lines records read from stdin are each upgraded, with one result record streamed to stdout per input record."""
+    legacy_dict = load_test_json(
+        example_dictionaries_path
+        / "legacy_schema_dictionary_with_transformation.json"
+    )
+    latest_dict = load_test_json(
+        example_dictionaries_path / "latest_schema_dictionary.json"
+    )
+    invalid_dict = load_test_json(
+        example_dictionaries_path / "invalid_dictionary.json"
+    )
+    records = [
+        {"id": "legacy", "dictionary": legacy_dict},
+        {"id": "latest", "dictionary": latest_dict},
+        {"id": "invalid", "dictionary": invalid_dict},
+    ]
+
+    result = runner.invoke(
+        bump_dictionary,
+        ["-", "--ndjson"],
+        input="\n".join(json.dumps(record) for record in records) + "\n",
+    )
+
+    results = [json.loads(line) for line in result.stdout.splitlines()]
+    assert result.exit_code == 1
+    assert [(res["id"], res["line"], res["status"]) for res in results] == [
+        ("legacy", 1, "upgraded"),
+        ("latest", 2, "current"),
+        ("invalid", 3, "invalid"),
+    ]
+    assert results[0]["dictionary"] == latest_dict
+    assert results[1]["dictionary"] == latest_dict
+    assert results[2]["dictionary"] is None
+    assert len(results[2]["errors"]) == 3
+
+
+def test_ndjson_malformed_record_reported(
+    load_test_json, example_dictionaries_path, runner, tmp_path
+):
+    """
+    Test that malformed JSON-lines records, including records with invalid encoding, are reported as invalid
+    with their line number, without stopping the remaining records.
+    """
+    latest_dict = load_test_json(
+        example_dictionaries_path / "latest_schema_dictionary.json"
+    )
+    records_path = tmp_path / "records.ndjson"
+    records_path.write_bytes(
+        b"not json\n"
+        + '{"id": "dataset-\u00e9"}\n'.encode("latin-1")
+        + b"\n"
+        + json.dumps({"id": "valid", "dictionary": latest_dict}).encode()
+        + b"\n"
+    )
+
+    result = runner.invoke(bump_dictionary, [str(records_path), "--ndjson"])
+
+    results = [json.loads(line) for line in result.stdout.splitlines()]
+    assert result.exit_code == 1
+    assert [(res["line"], res["status"]) for res in results] == [
+        (1, "invalid"),
+        (2, "invalid"),
+        (4, "current"),
+    ]
+    assert "Not valid JSON" in results[0]["errors"][0]
+    assert "UTF-8" in results[1]["errors"][0]
+
+
+def test_ndjson_unreadable_path_reported(runner, tmp_path, caplog):
+    """Test that an NDJSON input path that cannot be read (e.g., a directory) is reported as an error."""
+    result = runner.invoke(bump_dictionary, [str(tmp_path), "--ndjson"])
+
+    assert result.exit_code == 1
+    assert f"Could not read {tmp_path}" in caplog.text
+
+
+def test_transformation_renaming_details_only_logged_at_debug(
+    example_dictionaries_path, runner, example_output_path, caplog
+):
+    """Test that per-column details of renaming 'Transformation' to 'Format' are only logged at debug verbosity."""
+    input_path = (
+        example_dictionaries_path
+        / "legacy_schema_dictionary_with_transformation.json"
+    )
+
+    runner.invoke(bump_dictionary, [str(input_path), str(example_output_path)])
+    assert "pheno_age" not in caplog.text
+
+    caplog.clear()
+    runner.invoke(
+        bump_dictionary,
+        [str(input_path), str(example_output_path), "-f", "-v", "2"],
+    )
+    assert (
+        "Renaming 'Transformation' to 'Format' for column annotation: pheno_age"
+        in caplog.text
+    )
+
+
+def test_json_log_format(
+    example_dictionaries_path, runner, example_output_path
+):
+    """Test that the json log format writes each log as a JSON object to stderr, without using rich."""
+    result = runner.invoke(
+        bump_dictionary,
+        [
+            str(example_dictionaries_path / "legacy_schema_dictionary.json"),
+            str(example_output_path),
+            "--log-format",
+            "json",
+        ],
+    )
+
+    log_records = [json.loads(line) for line in result.stderr.splitlines()]
+    assert result.exit_code == 0
+    assert [type(handler) for handler in logger.handlers] == [
+        logging.StreamHandler
+    ]
+    assert log_records[-1]["level"] == "INFO"
+    assert "Successfully updated data dictionary" in log_records[-1]["message"]
+
+
+def test_watcher_only_revalidates_changed_columns(
+    load_test_json, example_dictionaries_path, tmp_path
+):
+    """Test that re-upgrading a watched data dictionary only re-validates the columns that were edited."""
+    legacy_dict = load_test_json(
+        example_dictionaries_path / "legacy_schema_dictionary.json"
+    )
+    target_latest_dict = load_test_json(
+        example_dictionaries_path / "latest_schema_dictionary.json"
+    )
+    watched_path = tmp_path / "dictionary.json"
+    watched_path.write_text(json.dumps(legacy_dict))
+    watcher = DictionaryWatcher()
+
+    result = watcher.upgrade_file(watched_path)
+    assert result.status == "upgraded"
+    assert result.num_revalidated_cols == len(legacy_dict)
+    assert result.data_dictionary == target_latest_dict
+
+    legacy_dict["pheno_age"]["Description"] = "Edited description"
+    del legacy_dict["participant_id"]["Annotations"]["Identifies"]
+    watched_path.write_text(json.dumps(legacy_dict))
+
+    result = watcher.upgrade_file(watched_path)
+    assert result.status == "invalid"
+    assert result.num_revalidated_cols == 2
+    assert len(result.errors) == 1
+    assert result.errors[0].startswith("participant_id:")
+
+
+def test_watcher_reports_unreadable_file_as_invalid(tmp_path):
+    """Test that a watched file that can no longer be read is reported as invalid instead of raising an error."""
+    watcher = DictionaryWatcher()
+
+    for unreadable_path in [tmp_path / "missing.json", tmp_path]:
+        result = watcher.upgrade_file(unreadable_path)
+        assert result.status == "invalid"
+        assert result.errors[0].startswith("Could not read file")
+
+
+class StopWatching(Exception):
+    pass
+
+
+def test_watch_path_debounces_burst_of_changes(tmp_path):
+    """Test that a burst of changes to watched files results in a single call to the change callback."""
+    watched_path = tmp_path / "dictionary.json"
+    watched_path.write_text("{}")
+    removed_path = tmp_path / "removed.json"
+    removed_path.write_text("{}")
+    calls = queue.Queue()
+
+    def on_change(changed, removed):
+        calls.put((changed, removed))
+        raise StopWatching
+
+    def watch():
+        try:
+            watch_path(
+                tmp_path, on_change, poll_interval=0.01, debounce_interval=0.2
+            )
+        except StopWatching:
+            pass
+
+    watch_thread = threading.Thread(target=watch, daemon=True)
+    watch_thread.start()
+    # Give the watcher time to take its initial snapshot
+    time.sleep(0.1)
+    for i in range(5):
+        watched_path.write_text(json.dumps({"col": {"Description": str(i)}}))
+        time.sleep(0.02)
+    removed_path.unlink()
+
+    changed, removed = calls.get(timeout=5)
+    watch_thread.join(timeout=5)
+    assert changed == [watched_path]
+    assert removed == [removed_path]
+    assert calls.empty()
+
+
+def test_watch_mode_writes_output_only_after_upgrade(
+    load_test_json,
+    example_dictionaries_path,
+    runner,
+    tmp_path,
+    monkeypatch,
+):
+    """
+    Test that in --watch mode, the output is saved after each successful upgrade but not after an invalid change,
+    and that removed files are reported.
+    """
+    legacy_dict = load_test_json(
+        example_dictionaries_path / "legacy_schema_dictionary.json"
+    )
+    target_latest_dict = load_test_json(
+        example_dictionaries_path / "latest_schema_dictionary.json"
+    )
+    watched_path = tmp_path / "dictionary.json"
+    watched_path.write_text(json.dumps(legacy_dict))
+    output_path = tmp_path / "updated_dictionary.json"
+
+    def fake_watch_path(path, on_change):
+        assert load_test_json(output_path) == target_latest_dict
+
+        legacy_dict["pheno_age"]["Description"] = "Edited description"
+        watched_path.write_text(json.dumps(legacy_dict))
+        on_change([watched_path], [])
+        assert (
+            load_test_json(output_path)["pheno_age"]["Description"]
+            == "Edited description"
+        )
+
+        del legacy_dict["participant_id"]["Annotations"]["Identifies"]
+        watched_path.write_text(json.dumps(legacy_dict))
+        on_change([watched_path], [])
+        assert "Identifies" not in json.dumps(load_test_json(output_path))
+        assert (
+            load_test_json(output_path)["participant_id"]
+            == target_latest_dict["participant_id"]
+        )
+
+        watched_path.unlink()
+        on_change([], [watched_path])
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr("bump_dictionary.cli.watch_path", fake_watch_path)
+    result = runner.invoke(
+        bump_dictionary, [str(watched_path), str(output_path), "--watch"]
+    )
+
+    assert result.exit_code == 0
+    assert [
+        line.split(" (")[0]
+        for line in result.stdout.splitlines()
+        if not line.startswith(" -> ")
+    ] == [
+        f"{watched_path}: upgraded",
+        f"{watched_path}: upgraded",
+        f"{watched_path}: invalid",
+        f"{watched_path}: removed",
+    ]
+
+
+def test_watch_mode_output_overwrite_guard(
+    example_dictionaries_path, runner, tmp_path, monkeypatch
+):
+    """
+    Test that --watch on a file does not overwrite an existing output file without --overwrite,
+    and that --watch on a directory rejects an output path and ignores the default one.
+    """
+    output_path = tmp_path / "updated_dictionary.json"
+    output_path.write_text("{}")
+
+    def fake_watch_path(path, on_change):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr("bump_dictionary.cli.watch_path", fake_watch_path)
+
+    result = runner.invoke(
+        bump_dictionary,
+        [
+            str(example_dictionaries_path / "legacy_schema_dictionary.json"),
+            str(output_path),
+            "--watch",
+        ],
+    )
+    assert result.exit_code != 0
+    assert "already exists" in result.output
+    assert output_path.read_text() == "{}"
+
+    result = runner.invoke(
+        bump_dictionary,
+        [str(example_dictionaries_path), str(output_path), "--watch"],
+    )
+    assert result.exit_code == 2
+    assert "Invalid value" in result.output
+
+    # The default output path exists in the current directory, but is not used when watching a directory
+    monkeypatch.chdir(tmp_path)
+    result = runner.invoke(
+        bump_dictionary, [str(example_dictionaries_path), "--watch"]
+    )
+    assert result.exit_code == 0
+    assert output_path.read_text() == "{}"
+
+
+def test_watch_directory_skips_non_dictionaries(
+    load_test_json, example_dictionaries_path, runner, tmp_path, monkeypatch
+):
+    """
+    Test that --watch on a directory reports JSON files that are not shaped like a data dictionary as skipped,
+    and does not search hidden directories.
+    """
+    (tmp_path / "dictionary.json").write_text(
+        json.dumps(
+            load_test_json(
+                example_dictionaries_path / "legacy_schema_dictionary.json"
+            )
+        )
+    )
+    (tmp_path / "dataset_description.json").write_text(
+        json.dumps({"Name": "My dataset", "BIDSVersion": "1.8.0"})
+    )
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "hidden.json").write_text("{}")
+
+    def fake_watch_path(path, on_change):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr("bump_dictionary.cli.watch_path", fake_watch_path)
+    result = runner.invoke(bump_dictionary, [str(tmp_path), "--watch"])
+
+    assert result.exit_code == 0
+    assert [line.split(" (")[0] for line in result.stdout.splitlines()] == [
+        f"{tmp_path / 'dataset_description.json'}: skipped",
+        f"{tmp_path / 'dictionary.json'}: upgraded",
+    ]
+
+
+def test_file_scanner_detects_added_and_removed_files(tmp_path, monkeypatch):
+    """
+    Test that the file scanner picks up files added to and removed from nested directories,
+    and only re-lists directories that changed.
+    """
+    # Trust directory listings immediately, so that listings are reused within the test
+    monkeypatch.setattr("bump_dictionary.watch.RACY_LISTING_INTERVAL_NS", -1)
+    (tmp_path / "sub").mkdir()
+    existing_path = tmp_path / "dictionary.json"
+    existing_path.write_text("{}")
+    scanner = FileScanner(tmp_path)
+    assert list(scanner.snapshot()) == [existing_path]
+
+    scanned_dirs = []
+    scandir = os.scandir
+
+    def counting_scandir(path):
+        scanned_dirs.append(Path(path))
+        return scandir(path)
+
+    monkeypatch.setattr("bump_dictionary.watch.os.scandir", counting_scandir)
+    added_path = tmp_path / "sub" / "added.json"
+    added_path.write_text("{}")
+    assert list(scanner.snapshot()) == [existing_path, added_path]
+    assert scanned_dirs == [tmp_path / "sub"]
+
+    added_path.unlink()
+    assert list(scanner.snapshot()) == [existing_path]
+
+
+def test_get_changed_files():
+    """Test that added and modified files are reported as changed, and missing files as removed."""
+    previous = {
+        Path("unchanged.json"): (1, 10),
+        Path("modified.json"): (1, 10),
+        Path("removed.json"): (1, 10),
+    }
+    current = {
+        Path("unchanged.json"): (1, 10),
+        Path("modified.json"): (2, 10),
+        Path("added.json"): (1, 10),
+    }
+
+    changed, removed = get_changed_files(previous, current)
+
+    assert changed == [Path("modified.json"), Path("added.json")]
+    assert removed == [Path("removed.json")]
+
+
+@pytest.mark.parametrize("log_format", ["plain", "json"])
+def test_non_rich_log_formats_strip_markup(
+    runner, example_output_path, tmp_path, log_format
+):
+    """Test that the plain and json log formats do not print rich markup literally."""
+    input_path = tmp_path / "dictionary.json"
+    input_path.write_bytes('{"col": "\u00e9"}'.encode("latin-1"))
+
+    result = runner.invoke(
+        bump_dictionary,
+        [
+            str(input_path),
+            str(example_output_path),
+            "--log-format",
+            log_format,
+        ],
+    )
+
+    assert result.exit_code == 1
+    assert "must have UTF-8 encoding" in result.stderr
+    assert "TIP:" in result.stderr
+    assert "[italic]" not in result.stderr
+    if log_format == "json":
+        log_record = json.loads(result.stderr.splitlines()[-1])
+        assert datetime.fromisoformat(log_record["time"]).tzinfo is not None
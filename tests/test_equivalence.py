@@ -0,0 +1,149 @@
+"""
+Differential tests checking that every execution mode of the app agrees with the reference
+single-file upgrade on randomly generated data dictionaries.
+"""
+
+import json
+import random
+
+import pytest
+from typer.testing import CliRunner
+
+from bump_dictionary.cli import bump_dictionary
+from bump_dictionary.watch import DictionaryWatcher
+
+from .dictionary_generators import generate_dictionary
+
+NUM_GENERATED_DICTIONARIES = 200
+
+
+@pytest.fixture(scope="module")
+def runner():
+    return CliRunner()
+
+
+def run_reference_upgrade(runner, data_dictionary, tmp_path, caplog):
+    """
+    Upgrade a data dictionary file with the default mode of the app, and return
+    the status, output file contents, and set of reported errors.
+    """
+    input_path = tmp_path / "dictionary.json"
+    output_path = tmp_path / "updated_dictionary.json"
+    input_path.write_text(
+        json.dumps(data_dictionary, ensure_ascii=False), encoding="utf-8"
+    )
+
+    caplog.clear()
+    result = runner.invoke(
+        bump_dictionary, [str(input_path), str(output_path), "-f"]
+    )
+
+    if result.exit_code == 0:
+        return "upgraded", output_path.read_text(encoding="utf-8"), set()
+    if "already up-to-date" in caplog.text:
+        return "current", None, set()
+    errors = {
+        line.removeprefix(" -> ")
+        for record in caplog.records
+        for line in record.getMessage().splitlines()
+        if line.startswith(" -> ")
+    }
+    return "invalid", None, errors
+
+
+def run_ndjson_upgrade(runner, data_dictionary):
+    """Upgrade a data dictionary record with the NDJSON mode, and return the parsed result record and the raw stdout bytes."""
+    result = runner.invoke(
+        bump_dictionary,
+        ["-", "--ndjson"],
+        input=json.dumps(
+            {"id": "generated", "dictionary": data_dictionary},
+            ensure_ascii=False,
+        ),
+    )
+    (result_record,) = [
+        json.loads(line) for line in result.stdout.splitlines()
+    ]
+    return result_record, result.stdout_bytes
+
+
+def run_watcher_upgrade(data_dictionary, tmp_path):
+    """Upgrade a data dictionary file with a fresh watcher, as the watch mode does on each change, and return the result."""
+    input_path = tmp_path / "watched_dictionary.json"
+    input_path.write_text(
+        json.dumps(data_dictionary, ensure_ascii=False), encoding="utf-8"
+    )
+    return DictionaryWatcher().upgrade_file(input_path)
+
+
+def run_check(runner, data_dictionary, tmp_path, full_validation):
+    """Check a data dictionary file with the check mode, and return the reported status."""
+    input_path = tmp_path / "dictionary.json"
+    input_path.write_text(
+        json.dumps(data_dictionary, ensure_ascii=False), encoding="utf-8"
+    )
+    args = [str(input_path), "--check"]
+    if full_validation:
+        args.append("--full-validation")
+    result = runner.invoke(bump_dictionary, args)
+    return result.stdout.splitlines()[0].rsplit(": ", 1)[-1]
+
+
+@pytest.mark.parametrize("seed", range(NUM_GENERATED_DICTIONARIES))
+def test_execution_modes_match_reference_upgrade(
+    runner, tmp_path, caplog, seed
+):
+    """
+    Test that for a random data dictionary, the NDJSON and watch modes report the same status and errors as the reference upgrade,
+    and produce an equivalent serialization of the upgraded data dictionary: the NDJSON output line is identical
+    to the expected result record built from the reference output file, and the watch mode output is identical
+    to the reference output file when serialized the same way. The check modes must also report a consistent status.
+    """
+    data_dictionary = generate_dictionary(random.Random(seed))
+
+    ref_status, ref_output, ref_errors = run_reference_upgrade(
+        runner, data_dictionary, tmp_path, caplog
+    )
+    ndjson_result, ndjson_stdout = run_ndjson_upgrade(runner, data_dictionary)
+    watcher_result = run_watcher_upgrade(data_dictionary, tmp_path)
+    full_check_status = run_check(
+        runner, data_dictionary, tmp_path, full_validation=True
+    )
+    key_scan_status = run_check(
+        runner, data_dictionary, tmp_path, full_validation=False
+    )
+
+    assert ndjson_result["status"] == ref_status
+    assert set(ndjson_result["errors"]) == ref_errors
+    assert watcher_result.status.value == ref_status
+    assert set(watcher_result.errors) == ref_errors
+    if ref_status == "upgraded":
+        # The NDJSON mode writes one compact JSON result record per line, so compare its whole raw output line
+        # against the result record expected from the reference output
+        expected_ndjson_line = json.dumps(
+            {
+                "id": "generated",
+                "line": 1,
+                "status": "upgraded",
+                "dictionary": json.loads(ref_output),
+                "errors": [],
+            },
+            ensure_ascii=False,
+        )
+        assert ndjson_stdout == f"{expected_ndjson_line}\n".encode()
+        assert (
+            json.dumps(
+                watcher_result.data_dictionary, ensure_ascii=False, indent=2
+            )
+            == ref_output
+        )
+
+    expected_check_status = {
+        "upgraded": "upgradable",
+        "current": "current",
+        "invalid": "invalid",
+    }[ref_status]
+    assert full_check_status == expected_check_status
+    # The key scan does not validate annotation contents, so it can only be expected to agree on valid dictionaries
+    if expected_check_status != "invalid":
+        assert key_scan_status == expected_check_status